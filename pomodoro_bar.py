@@ -3,24 +3,27 @@
 A simple pomodoro timer that supports pause, configuration, and statistics
 With polybar and xmobar integrations.
 """
-from functools import reduce
 import argparse
-import copy
-from datetime import datetime, timedelta, date
+import atexit
+from datetime import timedelta, date
 from enum import Enum, auto
+from itertools import count
 import json
-from math import floor
+from math import ceil
 from operator import itemgetter
 import os
 from pathlib import Path
+import select
+import shlex
 from shutil import get_terminal_size, which
+import signal
 from statistics import mean
+import subprocess
 import sys
 import termios
 import textwrap
 import time
-import tty
-from typing import Callable, Iterator, List, NamedTuple, Tuple, Union, Generator
+from typing import Callable, Iterator, List, NamedTuple, Tuple, Union
 
 
 class CustomHelpFormatter(argparse.ArgumentDefaultsHelpFormatter):
@@ -93,45 +96,51 @@ def bar_create_label(s: Session) -> str:
 
 
 def bar_create_status(ts: TimerIdleStatus, s: Session) -> str:
-    if ts == TimerIdleStatus.PAUSE:
-        return "PAUSE"
-    return "START" if s.type == SessionType.WORK else "BREAK"
+    return BAR_STATUSES[ts, s.type]
 
 
-def bar_update(bartype: BarType, working: bool, text: str) -> None:
-    (path_w, path_i) = named_pipe_get_paths(bartype)
-    if path_w == None or path_i == None:
+def bar_update(bartype: BarType, working: bool, text: bytes) -> None:
+    (path_i, path_w) = named_pipe_get_paths(bartype)
+    if path_i == None or path_w == None:
         return
     else:
-        (text_w, text_i) = ("", text) if working else (text, "")
-        named_pipe_write(path_w, text_w)
+        (text_i, text_w) = (b"", text) if working else (text, b"")
         named_pipe_write(path_i, text_i)
+        named_pipe_write(path_w, text_w)
 
 
-def cli_create_progressbar(s: Session) -> str:
+def cli_build_progressbar(n: int) -> str:
     bar = "w-b-w-b-w-b-w-l"
-    i = 4 * ((s.num - 1) % 4) + (0 if s.type == SessionType.WORK else 2)
+    i = 2 * n
     return (bar[:i] + "[" + bar[i:i + 1] + "]" + bar[i + 1:])
 
 
-def cli_get_echo_functions() -> Tuple[Callable[[], None], Callable[[], None]]:
+def cli_create_progressbar(s: Session) -> str:
+    return PROGRESS_BARS[((s.num - 1) & 3) << 1
+                         | (s.type != SessionType.WORK)]
+
+
+def cli_get_tty_functions() -> Tuple[Callable[[], None], Callable[[], None]]:
+    # no echo and no line buffering, but keep ISIG so CTRL+c still pauses
     fd = sys.stdin.fileno()
     attr_old = termios.tcgetattr(fd)
     attr_new = termios.tcgetattr(fd)
-    attr_new[3] = attr_new[3] & ~termios.ECHO  # lflags
-    disable_echo = lambda: termios.tcsetattr(fd, termios.TCSADRAIN, attr_new)
-    restore_echo = lambda: termios.tcsetattr(fd, termios.TCSADRAIN, attr_old)
-    return disable_echo, restore_echo
+    attr_new[3] = attr_new[3] & ~(termios.ECHO | termios.ICANON)  # lflags
+    attr_new[6][termios.VMIN] = 1
+    attr_new[6][termios.VTIME] = 0
+    enter_cbreak = lambda: termios.tcsetattr(fd, termios.TCSADRAIN, attr_new)
+    restore_tty = lambda: termios.tcsetattr(fd, termios.TCSADRAIN, attr_old)
+    return enter_cbreak, restore_tty
 
 
 def cli_hide_cursor() -> None:
     #     if os.name == 'posix':
-    print("\x1b[?25l", end="")
+    cli_write(b"\x1b[?25l")
 
 
 def cli_show_cursor() -> None:
     #     if os.name == 'posix':
-    print("\x1b[?25h", end="")
+    cli_write(b"\x1b[?25h")
 
 
 def cli_get_timer_keyhint(s: Session) -> str:
@@ -140,61 +149,82 @@ def cli_get_timer_keyhint(s: Session) -> str:
     return "CTRL+c to Skip"
 
 
-def cli_update(text: str) -> None:
-    w = get_terminal_size().columns
-    print("\r\033[2K" + text[:w], end='')
+def cli_track_terminal_width() -> None:
+    update_width = lambda *_: TERM_WIDTH.__setitem__(
+        0, get_terminal_size().columns)
+    signal.signal(signal.SIGWINCH, update_width)
+
 
+def cli_update(text: bytes) -> None:
+    cli_write(b"\r\033[2K" + text[:TERM_WIDTH[0]])
 
-def date_get_monday(week_offset: int) -> date:
-    today = datetime.now().date()
+
+def cli_write(data: bytes) -> None:
+    sys.stdout.buffer.write(data)
+    sys.stdout.buffer.flush()
+
+
+def date_get_monday(week_offset: int,
+                    today: Union[date, None] = None) -> date:
+    today = today or date.today()
     return today - timedelta(days=(today.weekday() + week_offset * 7))
 
 
-def display_create_hhmmss(sec: int) -> str:
+def display_create_hhmmss(sec: int) -> bytes:
     minute, second = divmod(sec, 60)
     hour, minute = divmod(minute, 60)
-    hour_str = str(hour).zfill(2) + ":" if hour > 0 else ''
-    return hour_str + str(minute).zfill(2) + ":" + str(second).zfill(2)
-
-
-def display_sync_with_timer(s: Session, bartype: BarType) \
-                            -> Generator[None, int, None]:
-    bar_label = bar_create_label(s)
-    keyhint = cli_get_timer_keyhint(s)
-    progress_bar = cli_create_progressbar(s)
-    working = s.type == SessionType.WORK
-    while True:
-        sec = (yield)
-        if (sec >= 0):
+    if hour > 0:
+        return b"%02d:%02d:%02d" % (hour, minute, second)
+    return TWO_DIGITS[minute] + b":" + TWO_DIGITS[second]
+
+
+def display_create_updater(s: Session,
+                           bartype: BarType) -> Callable[[int], None]:
+    # only the digits change from tick to tick
+    bar_prefix = bar_create_label(s).encode()
+    cli_prefix = (cli_create_progressbar(s) + " ").encode()
+    cli_suffix = (" - " + cli_get_timer_keyhint(s)).encode()
+    working = s.type is SessionType.WORK
+    last_sec = -1
+
+    def update(sec: int) -> None:
+        nonlocal last_sec
+        if (sec >= 0) and sec != last_sec:  # redraw only when digits change
+            last_sec = sec
             digit = display_create_hhmmss(sec)
 
-            cli_update(text=progress_bar + " " + digit + " - " + keyhint)
-            bar_update(bartype, working, text=bar_label + digit)
+            cli_update(text=cli_prefix + digit + cli_suffix)
+            bar_update(bartype, working, text=bar_prefix + digit)
 
+    return update
 
-def get_user_choice(charset: List[str]) -> str:
-    fd = sys.stdin.fileno()
-    attr_old = termios.tcgetattr(fd)
-    tty.setraw(fd, when=termios.TCSAFLUSH)
-
-    ch = keep_asking_for_choice(charset)
 
-    termios.tcsetattr(fd, termios.TCSADRAIN, attr_old)
-    return ch
+def get_user_choice(charset: List[str], on_idle: Callable[[], None]) -> str:
+    # discard keys typed while the timer was running
+    termios.tcflush(sys.stdin.fileno(), termios.TCIFLUSH)
+    return keep_asking_for_choice(charset, on_idle)
 
 
-def keep_asking_for_choice(charset: List[str]) -> str:
-    readchar = lambda: sys.stdin.buffer.read(1).decode(sys.stdin.encoding)
+def keep_asking_for_choice(charset: List[str],
+                           on_idle: Callable[[], None]) -> str:
     while True:
         try:
-            if (ch := readchar()) in charset:
+            if (ch := poll_choice(charset, timeout=1)) != None:
                 return ch
-            else:
-                pass
-        except UnicodeError:
+            on_idle()
+        except KeyboardInterrupt:  # CTRL+c only matters while timing
             pass
 
 
+def named_pipe_close(path: str) -> None:
+    os.close(PIPE_FDS.pop(path))
+
+
+def named_pipes_close() -> None:
+    for path in list(PIPE_FDS):
+        named_pipe_close(path)
+
+
 def named_pipe_ensure_exist(path: str) -> NamedPipeStatus:
     status = named_pipe_get_status(path)
     if status == NamedPipeStatus.INVALID:
@@ -214,6 +244,11 @@ def named_pipes_ensure_exist(bartype: BarType) -> None:
         or status_w == NamedPipeStatus.INVALID
     named_pipe_show_recompile_hint(will_show_hint, bartype)
 
+    for path in (path_i, path_w):
+        if path != None:
+            named_pipe_open(path)
+    atexit.register(named_pipes_close)
+
 
 def named_pipe_get_paths(
         bartype: BarType) -> Tuple[Union[str, None], Union[str, None]]:
@@ -229,6 +264,16 @@ def named_pipe_get_status(path: str) -> NamedPipeStatus:
     return NamedPipeStatus.INVALID
 
 
+def named_pipe_open(path: str) -> Union[int, None]:
+    # keep one non-blocking fd per pipe instead of reopening it on every tick
+    if path not in PIPE_FDS:
+        try:
+            PIPE_FDS[path] = os.open(path, os.O_WRONLY | os.O_NONBLOCK)
+        except OSError:  # no reader yet, retry on next write
+            return None
+    return PIPE_FDS[path]
+
+
 def named_pipe_show_recompile_hint(will_show: bool, bartype: BarType) -> None:
     if will_show:
         if bartype == BarType.XMOBAR:
@@ -238,8 +283,16 @@ def named_pipe_show_recompile_hint(will_show: bool, bartype: BarType) -> None:
         sys.exit()
 
 
-def named_pipe_write(path, text) -> None:
-    Path(path).write_text(text + "\n")
+def named_pipe_write(path: str, text: bytes) -> None:
+    fd = named_pipe_open(path)
+    if fd == None:
+        return
+    try:
+        os.writev(fd, (text, b"\n"))  # one syscall, no concatenation
+    except BlockingIOError:  # reader is not keeping up, drop this update
+        pass
+    except OSError:  # reader went away, reopen on next write
+        named_pipe_close(path)
 
 
 def parser_create() -> argparse.ArgumentParser:
@@ -248,7 +301,11 @@ def parser_create() -> argparse.ArgumentParser:
     def check_command_type(s: str) -> str:
         if s == '""':
             return ""
-        elif which(s.split(' ')[0]) == None:
+        try:
+            argv = shlex.split(s)
+        except ValueError:
+            raise type_err("%s is not a valid command" % s)
+        if not argv or which(argv[0]) == None:
             raise type_err("%s not found in PATH" % s)
         return s
 
@@ -305,14 +362,15 @@ def parser_create() -> argparse.ArgumentParser:
         default='""',
         metavar="CMD",
         help="System command to execute when work session ends\
-                (e.g. \"xset dpms force off\")",
+                (run without a shell) (e.g. \"xset dpms force off\")",
     )
     parser_timer.add_argument(
         "--cmdbreak",
         type=check_command_type,
         default='""',
         metavar="CMD",
-        help="Like --cmdwork but for unskipped break session",
+        help="Like --cmdwork but for unskipped break session\
+                (run without a shell)",
     )
     parser_timer.add_argument(
         "--bartype",
@@ -363,31 +421,41 @@ def parser_create() -> argparse.ArgumentParser:
     return parser
 
 
+def poll_choice(charset: List[str], timeout: float) -> Union[str, None]:
+    fd = sys.stdin.fileno()
+    if not select.select([fd], [], [], timeout)[0]:
+        return None
+    try:
+        ch = os.read(fd, 1).decode(sys.stdin.encoding)
+    except UnicodeError:
+        return None
+    return ch if ch in charset else None
+
+
 def record_add_session(work_min: int) -> None:
-    record_old = record_read(RECORD_PATH)
-    this_monday = str(date_get_monday(0))
-    today_letter = datetime.now().date().strftime("%a")
-    new_record = record_create_updated(record_old, this_monday, today_letter,
+    today = date.today()
+    this_monday = str(date_get_monday(0, today))
+    today_letter = DAYS_3_CHARS[today.weekday()]
+    new_record = record_create_updated(RECORD_CACHE, this_monday, today_letter,
                                        work_min)
-    record_update(new_record)
+    RECORD_CACHE.update(new_record)
+    record_update(RECORD_CACHE)
 
 
 def record_create_updated(old_record: Record, this_monday: str,
                           today_letter: str, minutes: int) -> Record:
-    new_record = copy.deepcopy(old_record)
-    if not this_monday in old_record:
-        days_3_chars = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
-        week_template = dict.fromkeys(days_3_chars, 0)
-        new_record[this_monday] = week_template
-
-    new_record[this_monday][today_letter] += minutes
+    # only the touched week is copied, the others are shared with old_record
+    new_record = dict(old_record)
+    week = dict(old_record.get(this_monday) or dict.fromkeys(DAYS_3_CHARS, 0))
+    week[today_letter] = week.get(today_letter, 0) + minutes
+    new_record[this_monday] = week
     return new_record
 
 
-def record_ensure_exist(path: str) -> None:
-    Path(path).parents[0].mkdir(mode=0o755, parents=True, exist_ok=True)
-    if not Path(path).is_file():
-        Path(path).write_text("{}")
+def record_ensure_exist(path: Path) -> None:
+    path.parents[0].mkdir(mode=0o755, parents=True, exist_ok=True)
+    if not path.is_file():
+        path.write_text("{}")
 
 
 def record_get_existing_week_summary(week: List[int], num_day: int,
@@ -407,38 +475,35 @@ def record_get_week_summary(record: Record, monday: str, num_day: int,
         return [""] * 8
 
 
-def record_prettify_onerow(max_cols: List[int], l: List[str]) -> str:
-    return '  '.join([y.rjust(x, ' ') for (x, y) in zip(max_cols, l)])
-
-
 def record_print_pretty(max_cols: List[int], res: List[List[str]]) -> None:
-    print(*[record_prettify_onerow(max_cols, x) for x in res], sep='\n')
+    fmt = '  '.join('{:>%d}' % x for x in max_cols)
+    print(*[fmt.format(*x) for x in res], sep='\n')
 
 
-def record_read(path: str) -> Record:
+def record_read(path: Path) -> Record:
     try:
-        result = json.loads(Path(path).read_text())
+        result = json_loads(path.read_bytes())
     except ValueError:
-        print(path + " is not a valid JSON")
+        print(str(path) + " is not a valid JSON")
         sys.exit()
     return result
 
 
 def record_update(updated_record: Record) -> None:
-    Path(RECORD_PATH).write_text(json.dumps(updated_record))
+    # write-then-rename so a crash never leaves a truncated record behind
+    RECORD_TMP_FILE.write_bytes(json_dumps(updated_record))
+    os.replace(RECORD_TMP_FILE, RECORD_FILE)
 
 
 def session_create(w: int, b: int, l: int, cmd_w: str, cmd_b: str,
                    n: int) -> Session:
-    get_alternate = lambda choice1, choice2, n: [choice1, choice2][(n - 1) % 2]
-    get_alternate_except_last = lambda choice1, choice2, last, n: \
-        get_alternate(choice1, choice2, n) if n % 8 > 0 else last
-
+    # odd n is a work session, even n a break, every 8th break is a long one
+    is_work = n & 1
     return Session(
-        num=floor((n + 1) / 2),
-        command=get_alternate(cmd_w, cmd_b, n),
-        seconds=get_alternate_except_last(w, b, l, n),
-        type=get_alternate(SessionType.WORK, SessionType.REST, n),
+        num=(n + 1) >> 1,
+        command=cmd_w if is_work else cmd_b,
+        seconds=w if is_work else (b if n & 7 else l),
+        type=SessionType.WORK if is_work else SessionType.REST,
     )
 
 
@@ -446,36 +511,39 @@ def session_generator(w: int, b: int, l: int, cmd_w: str, cmd_b: str,
                       start_session_num) -> Iterator[Session]:
     sessions_per_session_num = 2
     num_past_sessions = (start_session_num - 1) * sessions_per_session_num
-    n = num_past_sessions
-    while True:
-        n = n + 1
+    for n in count(num_past_sessions + 1):
         yield session_create(w, b, l, cmd_w, cmd_b, n)
 
 
 def session_loop(bartype: BarType, session: Iterator[Session]) -> None:
     while True:
-        session_start(next(session), bartype, TimerIdleStatus.TOBEGIN, 0)
+        session_start(next(session), bartype)
 
 
-def session_start(s: Session, bartype: BarType, \
-                        tmr_status: TimerIdleStatus, sec_left: int) -> None:
-    tmr_len = sec_left if tmr_status == TimerIdleStatus.PAUSE else s.seconds
-    digit = display_create_hhmmss(tmr_len)
-    bar_text = bar_create_label(s) + bar_create_status(tmr_status, s)
-    cli_text = cli_create_progressbar(s) + " " + digit + " - [s]tart or [q]uit"
-
-    bar_update(bartype, working=False, text=bar_text)
-    cli_update(cli_text)
-
-    if get_user_choice(['q', 's']) == 's':
-        sec_left_new = timer(s, bartype, tmr_len)
-        timer_end_handler(s, sec_left_new)
-        if will_repeat_session(s, sec_left_new):
-            session_start(s, bartype, TimerIdleStatus.PAUSE, sec_left_new)
-    else:
-        cli_update("")  # clear line
-        bar_update(bartype, working=False, text='POMODORO')
-        sys.exit()
+def session_start(s: Session, bartype: BarType) -> None:
+    tmr_status, tmr_len = TimerIdleStatus.TOBEGIN, s.seconds
+    while True:
+        digit = display_create_hhmmss(tmr_len)
+        bar_text = (bar_create_label(s) +
+                    bar_create_status(tmr_status, s)).encode()
+        cli_text = cli_create_progressbar(s).encode() + b" " + digit \
+            + b" - [s]tart or [q]uit"
+
+        # keep refreshing the bar so one started after the prompt still gets it
+        refresh_bar = lambda: bar_update(bartype, working=False, text=bar_text)
+        refresh_bar()
+        cli_update(cli_text)
+
+        if get_user_choice(['q', 's'], on_idle=refresh_bar) == 's':
+            sec_left = timer(s, bartype, tmr_len)
+            timer_end_handler(s, sec_left)
+            if not will_repeat_session(s, sec_left):
+                return
+            tmr_status, tmr_len = TimerIdleStatus.PAUSE, sec_left
+        else:
+            cli_update(b"")  # clear line
+            bar_update(bartype, working=False, text=b"POMODORO")
+            sys.exit()
 
 
 def show_help(parser: argparse.ArgumentParser) -> None:
@@ -487,13 +555,14 @@ stats.\nThe record file is stored at $XDG_DATA_HOME/pomodoro-bar\
 
 
 def show_record_raw() -> None:
-    print(Path(RECORD_PATH).read_text())
+    print(RECORD_FILE.read_text())
 
 
 def show_record_summary(record: Record, w_min: int, num_week: int) -> None:
-    num_day_1st = datetime.now().date().weekday() + 1
-    monday_1st = str(date_get_monday(0))
-    monday_rest = [str(date_get_monday(x)) for x in list(range(1, num_week))]
+    today = date.today()
+    num_day_1st = today.weekday() + 1
+    monday_1st = str(date_get_monday(0, today))
+    monday_rest = [str(date_get_monday(x, today)) for x in range(1, num_week)]
 
     header = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun", "Avg"]
     header_sep = ["---"] * 8
@@ -504,8 +573,7 @@ def show_record_summary(record: Record, w_min: int, num_week: int) -> None:
     res = [header] + [header_sep] + [res_1st] + res_rest
 
     print("Number of " + str(w_min) + "-minute sessions from this week (top)")
-    lens = [list(map(len, x)) for x in res]
-    max_cols = reduce(lambda a, b: list(map(max, a, b)), lens, [0] * 8)
+    max_cols = [max(map(len, col)) for col in zip(*res)]
     record_print_pretty(max_cols, res)
 
 
@@ -516,25 +584,32 @@ Author: Theerawat Kiatdarakun")
 
 
 def timer(s: Session, bartype: BarType, sec: int) -> int:
-    display_update = display_sync_with_timer(s, bartype)
-    next(display_update)
+    display_update = display_create_updater(s, bartype)
+    end = time.monotonic() + sec
     try:
-        while sec > 0:
-            display_update.send(sec)
-            time.sleep(1)
-            sec = sec - 1
+        while (remaining := end - time.monotonic()) > 0:
+            sec = ceil(remaining)
+            display_update(sec)
+            time.sleep(remaining - sec + 1)  # until the next whole second
         return 0
     except KeyboardInterrupt:
         return sec
-    finally:
-        display_update.close()
 
 
 def timer_end_handler(s: Session, sec_left: int) -> None:
     if sec_left == 0:
         if s.type == SessionType.WORK:
             record_add_session(work_min=int(s.seconds / 60))
-        os.system(s.command)
+        if s.command:
+            # run without a shell and don't wait, the next session starts now
+            try:
+                subprocess.Popen(shlex.split(s.command),
+                                 start_new_session=True,
+                                 stdin=subprocess.DEVNULL,
+                                 stdout=subprocess.DEVNULL,
+                                 stderr=subprocess.DEVNULL)
+            except OSError:  # e.g. command removed since startup, keep going
+                pass
 
 
 def will_repeat_session(s: Session, sec_left: int) -> bool:
@@ -549,7 +624,35 @@ except ImportError:
     #     if os.name == 'posix':
     XDG_DATA_HOME = str(Path.home() / ".local/share")
 
+try:
+    import orjson
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+except ImportError:
+    json_loads = json.loads
+    json_dumps = lambda x: json.dumps(x, separators=(",", ":")).encode()
+
 RECORD_PATH = XDG_DATA_HOME + "/pomodoro-bar/record.json"
+RECORD_FILE = Path(RECORD_PATH)
+RECORD_TMP_FILE = RECORD_FILE.with_suffix(".json.tmp")
+RECORD_CACHE: Record = {}  # loaded once on timer start
+
+BAR_STATUSES = {
+    (TimerIdleStatus.TOBEGIN, SessionType.WORK): "START",
+    (TimerIdleStatus.TOBEGIN, SessionType.REST): "BREAK",
+    (TimerIdleStatus.PAUSE, SessionType.WORK): "PAUSE",
+    (TimerIdleStatus.PAUSE, SessionType.REST): "PAUSE",
+}
+
+DAYS_3_CHARS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+PIPE_FDS: dict[str, int] = {}
+
+PROGRESS_BARS = tuple(cli_build_progressbar(n) for n in range(8))
+
+TERM_WIDTH = [get_terminal_size().columns]  # refreshed on SIGWINCH
+
+TWO_DIGITS = tuple(b"%02d" % i for i in range(60))
 
 if __name__ == "__main__":
     parser = parser_create()
@@ -562,7 +665,7 @@ if __name__ == "__main__":
     elif 'raw' in args and args.raw:
         show_record_raw()
     elif 'record' in args and args.record:
-        show_record_summary(record_read(RECORD_PATH),
+        show_record_summary(record_read(RECORD_FILE),
                             w_min=args.work,
                             num_week=args.n)
     else:
@@ -570,7 +673,8 @@ if __name__ == "__main__":
             itemgetter( 'work', 'break', 'longbreak', 'session', 'cmdwork',
                         'cmdbreak', 'bartype')(vars(args))
 
-        record_ensure_exist(RECORD_PATH)
+        record_ensure_exist(RECORD_FILE)
+        RECORD_CACHE.update(record_read(RECORD_FILE))
         named_pipes_ensure_exist(bartype)
 
         (w_sec, b_sec, l_sec) = map(lambda x: x * 60, (w_min, b_min, l_min))
@@ -578,12 +682,13 @@ if __name__ == "__main__":
         session = session_generator(w_sec, b_sec, l_sec, cmd_w, cmd_b,
                                     start_session_num)
 
-        disable_keyboard_echo, restore_keyboard_echo = cli_get_echo_functions()
+        cli_track_terminal_width()
+        enter_cbreak_mode, restore_terminal = cli_get_tty_functions()
         try:
-            disable_keyboard_echo()
+            enter_cbreak_mode()
             cli_hide_cursor()
 
             session_loop(bartype, session)
         finally:
             cli_show_cursor()
-            restore_keyboard_echo()
+            restore_terminal()
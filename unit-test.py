@@ -1,15 +1,16 @@
 #!/usr/bin/env python3
 import unittest
 import pomodoro_bar as app
-from datetime import datetime
+from datetime import date, datetime
 
 
 class TestDisplay(unittest.TestCase):
     def test_hhmmss(self):
         t = lambda a: app.display_create_hhmmss(a)
-        self.assertEqual(t(1), '00:01')
-        self.assertEqual(t(111), '01:51')
-        self.assertEqual(t(3611), '01:00:11')
+        self.assertEqual(t(1), b'00:01')
+        self.assertEqual(t(111), b'01:51')
+        self.assertEqual(t(3611), b'01:00:11')
+        self.assertEqual(t(360000), b'100:00:00')
 
 
 class TestRecord(unittest.TestCase):
@@ -43,8 +44,22 @@ class TestRecord(unittest.TestCase):
 
         updated_twice = update(updated_once)
         self.assertEqual(sum_thisweek(updated_twice), sum_old + 50)
+
+        self.assertEqual(sum_thisweek(self.record), sum_old)
+        self.assertEqual(sum_thisweek(update({})), 25)
 #
 
+    def test_date_get_monday(self):
+        t = lambda week_offset: app.date_get_monday(week_offset,
+                                                    date(2022, 1, 13))
+        self.assertEqual(t(0), date(2022, 1, 10))
+        self.assertEqual(t(2), date(2021, 12, 27))
+
+    def test_record_get_existing_week_summary(self):
+        t = app.record_get_existing_week_summary([113, 272, 114, 184, 571,
+                                                  463, 0], 6, 25)
+        self.assertEqual(t[-1], '11.4')
+
     def test_record_get_week_summary(self):
         t = lambda week_offset: app.record_get_week_summary(
             self.record, str(app.date_get_monday(week_offset)), self.num_days,
@@ -98,6 +113,9 @@ class TestSession(unittest.TestCase):
         self.assertEqual(a, b)
         self.assertNotEqual(a, c)
 
+        nums = [next(self.session_iter).num for _ in range(7)]
+        self.assertEqual(nums, [2, 3, 3, 4, 4, 5, 5])
+
     def test_session_command(self):
         a = next(self.session_iter).command
         b = next(self.session_iter).command